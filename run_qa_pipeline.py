@@ -75,7 +75,7 @@ class QAPipeline:
     def _save_processed_files(self, processed_files: Set[str]):
         """Saves the set of processed filenames to the checkpoint file."""
         with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-            json.dump(list(processed_files), f, indent=4)
+            json.dump(sorted(processed_files), f, indent=4)
 
     async def run(self, test_mode: bool = False, sample_files: Optional[List[str]] = None):
         """
@@ -149,8 +149,9 @@ class QAPipeline:
         """
         self.logger.info(f"Processing file: {structured_file.name}")
         
-        with open(structured_file, 'r', encoding='utf-8') as f:
-            structured_content = json.load(f)
+        # Read off the event loop so concurrent files keep their API calls in flight
+        raw_content = await asyncio.to_thread(structured_file.read_text, encoding='utf-8')
+        structured_content = json.loads(raw_content)
 
         if not structured_content:
             self.logger.warning(f"Skipping empty file: {structured_file.name}")
@@ -18,6 +18,9 @@ logging.basicConfig(
     ]
 )
 
+# Translation table that deletes punctuation ignored during duplicate detection
+_PUNCTUATION_TABLE = str.maketrans('', '', '?.!,-')
+
 class QualityAssurance:
     """
     A pipeline for performing quality assurance tasks on the generated dataset.
@@ -44,11 +47,8 @@ class QualityAssurance:
         - Removes leading/trailing whitespace.
         - Removes common punctuation to catch near-identical questions.
         """
-        normalized = question.lower().strip()
         # Remove punctuation that might cause false negatives
-        for p in '?.!,-':
-            normalized = normalized.replace(p, '')
-        return normalized
+        return question.lower().strip().translate(_PUNCTUATION_TABLE)
 
     def run_deduplication(self):
         """
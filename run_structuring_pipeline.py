@@ -2,6 +2,7 @@ import os
 import json
 import asyncio
 import logging
+from pathlib import Path
 from typing import Set, Dict, Any
 from datetime import datetime, timezone
 
@@ -50,7 +51,7 @@ def save_processed_files(processed_files: Set[str], checkpoint_file: str):
     """Saves the set of processed files to the checkpoint file."""
     try:
         with open(checkpoint_file, 'w') as f:
-            json.dump(list(processed_files), f, indent=2)
+            json.dump(sorted(processed_files), f, indent=2)
     except IOError as e:
         logger.error(f"Could not write to checkpoint file {checkpoint_file}. Error: {e}")
 
@@ -92,8 +93,8 @@ class StructuringPipeline:
         """Runs a single file through the entire structuring pipeline."""
         logger.info(f"Starting processing for: {file_path}")
         
-        # 1. Clean
-        cleaned_file_path = self.cleaner.process_file(file_path)
+        # 1. Clean (blocking file I/O, so keep it off the event loop)
+        cleaned_file_path = await asyncio.to_thread(self.cleaner.process_file, file_path)
         if not cleaned_file_path:
             logger.error(f"Cleaning failed for {file_path}. Moving to dead-letter queue.")
             self._move_to_dead_letter(file_path)
@@ -101,8 +102,7 @@ class StructuringPipeline:
 
         # 2. Extract
         try:
-            with open(cleaned_file_path, 'r', encoding='utf-8') as f:
-                cleaned_text = f.read()
+            cleaned_text = await asyncio.to_thread(Path(cleaned_file_path).read_text, encoding='utf-8')
         except IOError as e:
             logger.error(f"Could not read cleaned file {cleaned_file_path}: {e}")
             self._move_to_dead_letter(file_path)